@@ -6,7 +6,7 @@ Authors:Daniela Cubillos
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter 
 from reportlab.pdfgen import canvas 
-from reportlab.lib.colors import HexColor
+from reportlab.lib.colors import Color, HexColor
 from lexical import LexicalAnalyzer
 from sintactic import SintacticAnalyzer
 from semantic import SemanticAnalyzer
@@ -19,6 +19,28 @@ class Compiler:
     generates pattern figures, and exports the final crochet pattern as a PDF.
     """
 
+    # Crochet abbreviations listed below the title of every pattern.
+    _TERMS = (
+        "Ch – Chain",
+        "Sc - Single crochet",
+        "Dc – Double Crochet",
+        "HDc - Half double crochet",
+        "Tr – Treble Crochet",
+        "MC – Magic Circle",
+        "Sl St – Slip Stitch",
+        "St – Stitch"
+    )
+
+    # Pattern constants indexed by figure size (1-5); index 0 is unused.
+    _SQUARE_INITIAL_CHAINS = (None, 5, 7, 9, 11, 13)
+    _HEART_BASE_STITCHES = (None, "sc", "hdc", "dc", "tr", "tr")
+    _HEART_INITIAL_CHAINS = (None, 1, 1, 2, 3, 2)
+    _HEART_TOTAL_STITCHES = (None, 6, 9, 11, 13, (12, 22, 31))
+
+    # Step number prefixes ("0.", "1.", ...) for generate_square, whose last
+    # step (FO) is numbered chain + 3 for the largest initial chain.
+    _STEP_NUMBERS = tuple(f"{i}." for i in range(max(_SQUARE_INITIAL_CHAINS[1:]) + 4))
+
     def __init__(self):
         # A dictionary mapping color names to their hexadecimal codes.
         self.hex_colors = {
@@ -28,14 +50,27 @@ class Compiler:
             "BLACK": "#000000"
         }
 
+        # Color objects for each color, parsed once instead of on every draw call.
+        self._color_objs = {name: HexColor(hex_) for name, hex_ in self.hex_colors.items()}
+        self._black = self._color_objs["BLACK"]
+
+        # A dictionary mapping figure commands to the methods that generate them.
+        self._gen = {
+            "addCircle": self.generate_circle,
+            "addSquare": self.generate_square,
+            "addTriangle": self.generate_triangle,
+            "addHeart": self.generate_heart
+        }
+
 
     def compile(self, code: str):
         """
         Compiles the given code.
 
         1. Uses LexicalAnalyzer to extract tokens.
-        2. Uses SintacticAnalyzer to ensure tokens follow the grammar.
-        3. Uses SemanticAnalyzer to extract figures (with colors and sizes).
+        2. Uses SintacticAnalyzer to ensure tokens follow the grammar,
+           collecting the figures in the same pass.
+        3. Uses SemanticAnalyzer to obtain figures (with colors and sizes).
         4. Exports the generated pattern as a PDF.
         """
 
@@ -44,10 +79,10 @@ class Compiler:
 
         # Check that the tokens follow the grammar
         sintactic_analyzer = SintacticAnalyzer(tokens_)
-        sintactic_analyzer.parse()
+        parsed_figures = sintactic_analyzer.parse()
 
         # Extract figures, colors and sizes from the tokens, in format (figure, size, color)
-        semantic_analyzer_ = SemanticAnalyzer(tokens_)
+        semantic_analyzer_ = SemanticAnalyzer(tokens_, parsed_figures)
         figures = semantic_analyzer_.analyze()
         print(figures)
 
@@ -61,28 +96,22 @@ class Compiler:
         Each element in the 'figures' list is expected to be a tuple where:
           - fig[0] is the command (e.g., 'addCircle', 'addSquare', etc.).
           - fig[1] is the size.
-          - fig[2] is the color.
+          - fig[2] is the color, resolved here to its Color object.
+
+        Patterns are generated lazily, one figure at a time, so they can be drawn
+        and discarded without keeping every pattern in memory.
 
         Returns:
-            A list of tuples (steps, color_hex, name) representing the generated patterns.
+            An iterator of tuples (steps, color_obj, name) representing the generated patterns.
         """
 
-        patterns = []
-
-        for fig in figures:
-            if(fig[0] == 'addCircle'):
-                patterns.append(self.generate_circle(int(fig[1]), fig[2]))
-            elif(fig[0] == 'addSquare'):
-                patterns.append(self.generate_square(int(fig[1]), fig[2]))
-            elif(fig[0] == 'addTriangle'):
-                patterns.append(self.generate_triangle(int(fig[1]), fig[2]))
-            elif(fig[0] == 'addHeart'):
-                patterns.append(self.generate_heart(int(fig[1]), fig[2]))
+        color_objs = self._color_objs
+        return (
+            self._gen[fig[0]](int(fig[1]), color_objs[fig[2]]) for fig in figures
+        )
 
-        return patterns
 
-
-    def generate_circle(self, size: int, color: str):
+    def generate_circle(self, size: int, color: Color):
         """
         Generates a circle pattern with the given size and color.
 
@@ -90,26 +119,24 @@ class Compiler:
         based on the size. Finally, a FO (fasten off) step is appended.
 
         Returns:
-            A tuple (circle_steps, color_hex, "CIRCLE")
+            A tuple (circle_steps, color_obj, "CIRCLE")
         """
 
-        # Get the hex color from the dictionary
-        color = self.hex_colors.get(color)
         circle = [
         "1. 6 SC in magic ring",
         "2. 6 INC (12 SC)"
         ]
 
-        # Add aditional steps based in size
-        for i in range(size):
-            total_points = 18 + (i * 6)
-            step = f"{i+3}. ({i+1} SC, 1 INC) *6 ({total_points} SC)"
-            circle.append(step)
+        # Add aditional steps based in size, round i+3 having (18 + i*6) SC
+        circle.extend(
+            f"{i+3}. ({i+1} SC, 1 INC) *6 ({18 + i*6} SC)" for i in range(size)
+        )
 
-        circle.append(f"{len(circle)+1}. FO")
+        # The FO step comes right after the last round
+        circle.append(f"{size+3}. FO")
         return circle, color, "CIRCLE"
 
-    def generate_square(self, size: int, color: str):
+    def generate_square(self, size: int, color: Color):
         """
         Generates a square pattern with the given size and color.
 
@@ -117,15 +144,11 @@ class Compiler:
         subsequent instructions for forming the square, ending with FO.
 
         Returns:
-            A tuple (square_steps, color_hex, "SQUARE")
+            A tuple (square_steps, color_obj, "SQUARE")
         """
 
-        # Get the hex color from the dictionary
-        color = self.hex_colors.get(color)
-        initial_chains = {1: 5, 2: 7, 3: 9, 4: 11, 5: 13}
-
-        # Get the initial number of chains from the dictionary
-        chain = initial_chains.get(size)
+        # Get the initial number of chains for the size
+        chain = self._SQUARE_INITIAL_CHAINS[size]
 
         # Generate first square steps
         square = [
@@ -133,15 +156,17 @@ class Compiler:
             f"2. {chain} SC (starts since first stich)"
         ]
 
-        for _ in range(chain):
-            square.append(f"{len(square)+1}. Chain 1, turn and {chain} SC.")
+        # Add one row per chain, numbered from 3; only the step number changes
+        numbers = self._STEP_NUMBERS
+        row = f" Chain 1, turn and {chain} SC."
+        square.extend(numbers[k] + row for k in range(3, chain + 3))
 
         # Add final step
-        square.append(f"{len(square)+1}. FO")
+        square.append(numbers[chain + 3] + " FO")
 
         return square, color, "SQUARE"
 
-    def generate_triangle(self, size: int, color: str):
+    def generate_triangle(self, size: int, color: Color):
         """
         Generates a triangle pattern with the given size and color.
 
@@ -149,11 +174,9 @@ class Compiler:
         the number of SCs on each row until completion, ending with FO.
 
         Returns:
-            A tuple (triangle_steps, color_hex, "TRIANGLE")
+            A tuple (triangle_steps, color_obj, "TRIANGLE")
         """
 
-        color = self.hex_colors.get(color)
-        
         # Calcular hasta qué fila necesitamos basado en el tamaño
         final_row = size * 2 + 1
 
@@ -163,27 +186,21 @@ class Compiler:
             "2. Ch 1, turn. 3sc in the same space [3 sts]"
         ]
 
-        current_stitches = 3
-        row = 3
-
-        while row <= final_row:
-            if row % 2 == 1:
-                # Filas impares: sc en cada punto
-                triangle.append(f"{row}. Ch 1, turn. Sc in each st [{current_stitches} sts]")
-            else:
-                # Filas pares: incrementos en los extremos
-                new_stitches = current_stitches + 2
-                middle_sts = current_stitches - 2
-                triangle.append(f"{row}. Ch 1, turn. Inc, sc in next {middle_sts} sts, inc [{new_stitches} sts]")
-                current_stitches = new_stitches
-            row += 1
+        # Filas impares: sc en cada punto (la fila r tiene r puntos)
+        # Filas pares: incrementos en los extremos (de r-1 a r+1 puntos)
+        triangle.extend(
+            f"{row}. Ch 1, turn. Sc in each st [{row} sts]"
+            if row % 2 == 1
+            else f"{row}. Ch 1, turn. Inc, sc in next {row - 3} sts, inc [{row + 1} sts]"
+            for row in range(3, final_row + 1)
+        )
 
         # Añadir FO al final
-        triangle.append(f"{len(triangle) + 1}. FO")
+        triangle.append(f"{final_row + 1}. FO")
 
         return triangle, color, "TRIANGLE"
 
-    def generate_heart(self, size: int, color: str):
+    def generate_heart(self, size: int, color: Color):
         """
         Generates a heart pattern with the given size and color.
 
@@ -191,20 +208,13 @@ class Compiler:
         followed by additional steps to form the lobes of the heart, and finishes with FO.
 
         Returns:
-            A tuple (heart_steps, color_hex, "HEART")
+            A tuple (heart_steps, color_obj, "HEART")
         """
-        color = self.hex_colors.get(color)
-
 
-        # constants of the pattern
-        base_stitches = {1: "sc", 2: "hdc", 3: "dc", 4: "tr", 5: "tr"}
-        initial_chains = {1: 1, 2: 1, 3: 2, 4: 3, 5: 2}
-    
         # get values based on size
-        base_stitch = base_stitches[size]
-        chains = initial_chains[size]
-        total_stitches = {1: 6, 2: 9, 3: 11, 4: 13, 5: [12, 22, 31]}
-        stitches = total_stitches[size]
+        base_stitch = self._HEART_BASE_STITCHES[size]
+        chains = self._HEART_INITIAL_CHAINS[size]
+        stitches = self._HEART_TOTAL_STITCHES[size]
     
         # start the pattern
         pattern = ["1. Make a MC."]
@@ -266,7 +276,7 @@ class Compiler:
             margin_bottom: The bottom margin.
             height: The height of the page.
             margin_top: The top margin.
-            color: The hexadecimal color code for the steps.
+            color: The Color object for the steps.
 
         Returns:
             The updated y-coordinate.
@@ -275,8 +285,7 @@ class Compiler:
         if y < margin_bottom:
             c.showPage()
             c.setFont("Helvetica", 12)
-            color_obj = HexColor(color)
-            c.setFillColor(color_obj)
+            c.setFillColor(color)
             return height - margin_top
 
         return y
@@ -305,7 +314,7 @@ class Compiler:
 
         # Draw decorative line below the title
         c.setLineWidth(1)
-        c.setStrokeColor(HexColor("#000000"))
+        c.setStrokeColor(self._black)
         c.line(margin_left, title_y - 10, width - margin_right, title_y - 10)
         return title_y
 
@@ -320,30 +329,42 @@ class Compiler:
             height: The height of the page.
             margin_top: The top margin.
         """
-        terms = [
-            "Ch – Chain",
-            "Sc - Single crochet",
-            "Dc – Double Crochet",
-            "HDc - Half double crochet",
-            "Tr – Treble Crochet",
-            "MC – Magic Circle",
-            "Sl St – Slip Stitch",
-            "St – Stitch"
-        ]
-
         y = height - margin_top - 40
 
         c.setFont("Helvetica-Bold", 12)
         c.drawString(50, y, "US TERMS")
         y -= 25
         
-        c.setFont("Helvetica", 12)
-        for term in terms:
-            c.drawString(50, y, term)
-            y -= 20
-        return y
+        # Write all the terms in a single text object
+        textobj = c.beginText(50, y)
+        textobj.setFont("Helvetica", 12)
+        textobj.setLeading(20)
+        for term in self._TERMS:
+            textobj.textLine(term)
+        c.drawText(textobj)
+
+        return y - 20 * len(self._TERMS)
+
+
+    def begin_steps(self, c, y, color):
+        """
+        Creates a text object for writing pattern steps, one line every 20 points.
+
+        Args:
+            c: The canvas object.
+            y: The y-coordinate of the first line.
+            color: The Color object for the steps.
+
+        Returns:
+            The text object positioned at the left margin.
+        """
+
+        textobj = c.beginText(50, y)
+        textobj.setFont("Helvetica", 12)
+        textobj.setLeading(20)
+        textobj.setFillColor(color)
+        return textobj
 
-    
     def draw_pattern(self, c, steps, color, name, y, margin_bottom, height, margin_top):
         """
         Draws a single pattern, including its name and steps.
@@ -352,7 +373,7 @@ class Compiler:
         Args:
             c: The canvas object.
             steps: A list of strings representing the pattern steps.
-            color: The hexadecimal color code for the steps.
+            color: The Color object for the steps.
             name: The name of the pattern.
             y: The current y-coordinate.
             margin_bottom: The bottom margin.
@@ -367,36 +388,43 @@ class Compiler:
         y = self.check_page(c, y, margin_bottom, height, margin_top, color)
 
         # Draw the pattern name in bold black
-        c.setFillColor(HexColor("#000000"))
+        c.setFillColor(self._black)
         c.setFont("Helvetica-Bold", 14)
         c.drawString(50, y, name)
         y -= 25
 
-        # Convert the hexadecimal color code for the steps
-        color_obj = HexColor(color)
-        c.setFillColor(color_obj)
-        c.setFont("Helvetica", 12)
+        # Accumulate the steps of each page into a single text object
+        y = self.check_page(c, y, margin_bottom, height, margin_top, color)
+        textobj = self.begin_steps(c, y, color)
 
-        # Draw each step on a new line
+        # Write each step on a new line
         for step in steps:
-            y = self.check_page(c, y, margin_bottom, height, margin_top, color)
-            c.drawString(50, y, step)
+            if y < margin_bottom:
+                # Flush the current page before breaking to a new one
+                c.drawText(textobj)
+                y = self.check_page(c, y, margin_bottom, height, margin_top, color)
+                textobj = self.begin_steps(c, y, color)
+            textobj.textLine(step)
             y -= 20
 
+        c.drawText(textobj)
+
         # Add extra space after the pattern
         y -= 20
         return y
 
-    def create_pdf(self, patterns):
+    def create_pdf(self, figures):
         """
         Creates a PDF file named "PatronCrochet.pdf" that contains a title and a series of patterns.
-        Each pattern is a tuple (steps, color_hex, name). The PDF handles page breaks automatically.
+        Each pattern is generated from its figure right before being drawn.
+        The PDF handles page breaks automatically. Page compression is requested explicitly
+        so it stays on even if the user's rl_config overrides the ReportLab default.
 
         Args:
-            patterns: A list of tuples representing the patterns.
+            figures: A list of tuples with information to generate each figure.
         """
 
-        c = canvas.Canvas("PatronCrochet.pdf", pagesize=letter)
+        c = canvas.Canvas("PatronCrochet.pdf", pagesize=letter, pageCompression=1)
         width, height = letter
 
         # Define margins
@@ -416,7 +444,7 @@ class Compiler:
         y -= 20
 
         # Draw each pattern
-        for steps, color, name in patterns:
+        for steps, color, name in self.generate_figures(figures):
             y = self.draw_pattern(c, steps, color, name, y, margin_bottom, height, margin_top)
 
         c.save()
@@ -430,7 +458,6 @@ class Compiler:
             figures: A list of tuples with information to generate each figure.
         """
 
-        pattern = self.generate_figures(figures)
-        self.create_pdf(pattern)
+        self.create_pdf(figures)
         print("the pdf with your crochet pattern has been created! :)")
 
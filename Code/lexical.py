@@ -4,25 +4,78 @@ Authors:Daniela Cubillos
         Laura Daniela Munoz Ipus
 """
 
-import re
-
 class Token:
     """
     Represents a token with its type and associated value (lexeme).
 
+    Tokens are immutable, so the lexer can safely share one instance per lexeme.
+
     Attributes:
         type_ (str): The type of token (e.g., FIGURE, COLOR, KEYWORDS, SIZE, SPECIALCHAR).
         value (str): The lexeme extracted from the input code.
     """
 
+    __slots__ = ("type_", "value")
+
     def __init__(self, type_: str, value):
-        self.type_ = type_
-        self.value = value
+        object.__setattr__(self, "type_", type_)
+        object.__setattr__(self, "value", value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Token is immutable, cannot set {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Token is immutable, cannot delete {name}")
 
     def __repr__(self):
         return f"Token({self.type_}, {self.value})"
 
 
+# Map every reserved word to its (TOKEN_TYPE, LEXEME) pair. Tokens take their
+# lexeme from these constants instead of from slices of the input, so every
+# token value is an interned string and the parser's comparisons against
+# literals like "START" or "(" succeed on identity
+_WORDS = {
+    "addCircle": ("FIGURE", "addCircle"),       # Figure commands
+    "addSquare": ("FIGURE", "addSquare"),
+    "addTriangle": ("FIGURE", "addTriangle"),
+    "addHeart": ("FIGURE", "addHeart"),
+    "RED": ("COLOR", "RED"),                    # Figure colors
+    "PINK": ("COLOR", "PINK"),
+    "BLUE": ("COLOR", "BLUE"),
+    "BLACK": ("COLOR", "BLACK"),
+    "START": ("KEYWORDS", "START"),             # Start and end keywords
+    "END": ("KEYWORDS", "END"),
+}
+
+# Map every single-character token to its (TOKEN_TYPE, LEXEME) pair
+_CHARS = {
+    "(": ("SPECIALCHAR", "("),                  # Parentheses: ( and )
+    ")": ("SPECIALCHAR", ")"),
+    "1": ("SIZE", "1"),                         # Figure size (digits 1-5)
+    "2": ("SIZE", "2"),
+    "3": ("SIZE", "3"),
+    "4": ("SIZE", "4"),
+    "5": ("SIZE", "5"),
+}
+
+# Tokens cannot be modified once created, so the lexer hands out one shared
+# Token per lexeme instead of allocating a new one for every occurrence
+_WORD_TOKENS = {word: Token(*pair) for word, pair in _WORDS.items()}
+_CHAR_TOKENS = {char: Token(*pair) for char, pair in _CHARS.items()}
+
+# Group the reserved words by their first letter, keeping the order of _WORDS,
+# which is the order in which they are tried
+_WORDS_BY_INITIAL = {
+    initial: tuple(
+        (word, len(word), _WORD_TOKENS[word]) for word in _WORDS if word[0] == initial
+    )
+    for initial in dict.fromkeys(word[0] for word in _WORDS)
+}
+
+_WHITESPACE = frozenset(" \t\n\r")
+
+
 class LexicalAnalyzer:
     """
     Represents the behavior of a lexical analyzer that tokenizes the input code.
@@ -45,36 +98,38 @@ class LexicalAnalyzer:
 
         tokens = []
 
-        # Define token specifications as tuples of (TOKEN_TYPE, REGEX_PATTERN)
-        token_specification = [
-            ("FIGURE", r"addCircle|addSquare|addTriangle|addHeart"),    # Figure commands
-            ("COLOR", r"RED|PINK|BLUE|BLACK"),                          # Figure colors
-            ("KEYWORDS", r"START|END"),                                 # Start and end keywords
-            ("SIZE", r"[1-5]"),                                         # Figure size (digits 1-5)
-            ("SPECIALCHAR", r"\(|\)"),                                  # Parentheses: ( and )
-            ("SKIP", r"[ \t]+"),                                        # Skip spaces and tabs
-            ("MISMATCH", r"."),                                         # Any other character (error)
-        ]
-
-        # Combine all token patterns into a single regex using named groups
-        tok_regex = "|".join(
-            f"(?P<{pair[0]}>{pair[1]})" for pair in token_specification
-        )
-
-        # Iterate over all matches in the input code
-        for mo in re.finditer(tok_regex, code):
-            kind = mo.lastgroup # Get the name of the matched group (token type)
-            value = mo.group()  # Get the actual substring that matched
+        i = 0
+        n = len(code)
 
-            # If an unexpected character is encountered, raise an error.
-            if kind == "MISMATCH":
-                raise RuntimeError(f"{value} unexpected")
-            
-            # Skip over spaces and tabs.
-            if kind == "SKIP":
+        # Scan the input code one character at a time
+        while i < n:
+            char = code[i]
+
+            # Skip over whitespace.
+            if char in _WHITESPACE:
+                i += 1
+                continue
+
+            # Parentheses and sizes are single-character tokens.
+            token = _CHAR_TOKENS.get(char)
+            if token is not None:
+                tokens.append(token)
+                i += 1
                 continue
-            
-            # Create a new Token and add it to the tokens list.
-            tokens.append(Token(kind, value))
+
+            # A reserved word may start here; words need no separator between them.
+            candidates = _WORDS_BY_INITIAL.get(char)
+            if candidates is not None:
+                for word, length, token in candidates:
+                    if code.startswith(word, i):
+                        tokens.append(token)
+                        i += length
+                        break
+                else:
+                    raise RuntimeError(f"{char} unexpected")
+                continue
+
+            # If an unexpected character is encountered, raise an error.
+            raise RuntimeError(f"{char} unexpected")
 
         return tokens
\ No newline at end of file
@@ -3,6 +3,8 @@
 Authors:Daniela Cubillos
         Laura Daniela Munoz Ipus
 """
+from typing import Optional
+
 
 class SemanticAnalyzer:
     """
@@ -12,15 +14,18 @@ class SemanticAnalyzer:
         (figure, size, color)
     """
 
-    def __init__(self, tokens_input: list):
+    def __init__(self, tokens_input: list, figures: Optional[list] = None):
         """
         Initializes the SemanticAnalyzer with a list of tokens.
         
         Args:
             tokens_input (list): The list of tokens generated by the lexical analyzer.
+            figures (list): The (figure, size, color) tuples already collected by
+                the syntactic analyzer, if available.
         """
 
         self.tokens = tokens_input
+        self.parsed_figures = figures
         self.figures = []
 
     def analyze(self):
@@ -32,30 +37,35 @@ class SemanticAnalyzer:
             addCircle(3, ROJO)
             addTriangle(1, ROSADO) ...
             END
+
+        If the syntactic analyzer already collected the figures, they are returned
+        directly without scanning the tokens again.
         """
 
-        # Iterate through tokens
-        token_count = len(self.tokens)
-        i = 0
+        if self.parsed_figures is not None:
+            self.figures = self.parsed_figures
+            return self.figures
 
-        while i < token_count:
-            token = self.tokens[i]
-            if token.type_ == "FIGURE":
+        # Build each figure as a mutable [figure, size, color] list
+        figures = []
+
+        # Iterate through tokens
+        for token in self.tokens:
+            type_ = token.type_
+            if type_ == "FIGURE":
                 # Append the figure with None placeholders for size and color.
-                self.figures.append((token.value, None, None))
-                i += 1
-            elif token.type_ == "SIZE":
-                # Associate SIZE to the most recent figure if not already set.
-                if self.figures and self.figures[-1][1] is None:
-                    self.figures[-1] = (self.figures[-1][0], token.value, None)
-                i += 1
-            elif token.type_ == "COLOR":
+                figures.append([token.value, None, None])
+            elif type_ == "SIZE":
+                # Associate SIZE to the most recent figure if not already set,
+                # discarding any COLOR that appeared before it.
+                if figures and figures[-1][1] is None:
+                    figures[-1][1] = token.value
+                    figures[-1][2] = None
+            elif type_ == "COLOR":
                 # Associate COLOR to the most recent figure if not already set.
-                if self.figures and self.figures[-1][2] is None:
-                    self.figures[-1] = (self.figures[-1][0], self.figures[-1][1] ,token.value)
-                i += 1
-            else:
-                # Skip tokens that are not FIGURE, SIZE, or COLOR.
-                i += 1
+                if figures and figures[-1][2] is None:
+                    figures[-1][2] = token.value
+            # Tokens that are not FIGURE, SIZE, or COLOR are skipped.
 
+        self.figures = [tuple(figure) for figure in figures]
         return self.figures
\ No newline at end of file
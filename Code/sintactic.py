@@ -21,31 +21,27 @@ class SintacticAnalyzer:
     and ends with 'END'. Each figure must be followed by a specific structure of tokens.
     """
 
-    def __init__(self, tokens):
+    # Tokens expected after each FIGURE, as (TOKEN_TYPE, LEXEME, DESCRIPTION).
+    # A LEXEME of None accepts any value of the given type.
+    FIGURE_TAIL = (
+        ("SPECIALCHAR", "(", "( after FIGURE"),
+        ("SIZE", None, "SIZE"),
+        ("COLOR", None, "COLOR"),
+        ("SPECIALCHAR", ")", ")"),
+    )
+
+    def __init__(self, tokens, verbose=False):
         """
         Initializes the syntactic analyzer with a list of tokens.
         
         Args:
             tokens (list): A list of tokens produced by the lexical analyzer.
+            verbose (bool): If True, prints every parsed figure once parsing succeeds.
         """
 
         self.tokens = tokens
-        self.current_token = None
-        self.pos = -1
-        self.advance()
-
-    def advance(self):
-        """
-        Advances the current token pointer to the next token in the list.
-        
-        If there are no more tokens, sets current_token to None.
-        """
-
-        self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
-        else:
-            self.current_token = None
+        self.verbose = verbose
+        self.figures = []
 
     def parse(self):
         """
@@ -53,124 +49,71 @@ class SintacticAnalyzer:
         
         The process consists of checking:
             1. The start token ("START")
-            2. A valid sequence of figures
+            2. A valid sequence of figures, each one followed by the
+               token sequence in FIGURE_TAIL
             3. The end token ("END")
-        """
-
-        self.start()
-        self.figure_sequence()
-        self.end()
 
-    def start(self):
-        """
-        Checks if the first token is 'START'.
-        
-        Advances to the next token if the check is successful, otherwise
-        raises a syntax error.
-        """
-
-        if (
-            self.current_token.type_ == "KEYWORDS"
-            and self.current_token.value == "START"
-        ):
-            self.advance()
-        else:
-            self.error("START")
-
-    def end(self):
-        """
-        Checks if the current token is 'END' at the end of the sequence.
-        
-        Advances to the next token after 'END'. If extra tokens remain or
-        if 'END' is not found, raises a syntax error.
-        """
-
-        if (
-            self.current_token
-            and self.current_token.type_ == "KEYWORDS"
-            and self.current_token.value == "END"
-        ):
-            self.advance()
-            if self.current_token is not None:
-                self.error("No extra tokens expected after END")
-        else:
-            self.error("END")
-
-    def figure_sequence(self):
-        """
-        Processes the sequence of figure tokens.
-        
-        Continues to parse figures as long as the current token is of type 'FIGURE'.
-        """
-
-        while self.current_token and self.current_token.type_ == "FIGURE":
-            self.figure()
-
-    def figure(self):
-        """
-        Processes a single figure structure.
-        
-        Expected structure:
-            FIGURE "(" SIZE COLOR ")"
-        
-        Checks each token in the sequence:
-            - A FIGURE token
-            - An opening special character "("
-            - A SIZE token
-            - A COLOR token
-            - A closing special character ")"
-        
-        If the structure is valid, prints a formatted representation of the figure.
-        Otherwise, raises a syntax error indicating the expected token.
-        """
-        
-        if self.current_token and self.current_token.type_ == "FIGURE":
-            figure_value = self.current_token.value
-            self.advance()
-            
-            # Check for "(" following the figure.
-            if self.current_token and self.current_token.type_ == "SPECIALCHAR" and self.current_token.value == "(":
-                sc_value1 = self.current_token.value
-                self.advance()
-            else:
-                self.error("( after FIGURE")
-
-            # Check for SIZE token.
-            if self.current_token and self.current_token.type_ == "SIZE":
-                size_value = self.current_token.value
-                self.advance()
-            else:
-                self.error("SIZE")
-
-            # Check for COLOR token.
-            if self.current_token and self.current_token.type_ == "COLOR":
-                color_value = self.current_token.value
-                self.advance()
-            else:
-                self.error("COLOR")
-
-            # Check for ")" following the size and color.
-            if self.current_token and self.current_token.type_ == "SPECIALCHAR"  and self.current_token.value == ")":
-                sc_value2 = self.current_token.value
-                print(f"Figure: {figure_value}{sc_value1}{size_value} {color_value}{sc_value2}")
-                self.advance()
-            else:
-                self.error(")")
-
-        else:
-            self.error("FIGURE")
-
-    def error(self, expected):
-        """
-        Raises a SyntaxError when the current token does not match the expected token.
+        While checking, every figure is also collected in self.figures as a
+        (figure, size, color) tuple, so no further pass over the tokens is needed
+        to extract them.
+
+        Raises a syntax error indicating the expected token at the first mismatch.
+        If verbose is enabled, prints a formatted representation of every figure
+        after the whole sequence has been checked.
+
+        Returns:
+            list: The (figure, size, color) tuples found in the token sequence.
+        """
+
+        tokens = self.tokens
+        n = len(tokens)
+        tail = self.FIGURE_TAIL
+        figures = self.figures = []
+
+        # Check that the first token is 'START'.
+        if not n or tokens[0].type_ != "KEYWORDS" or tokens[0].value != "START":
+            self.error(0, "START")
+        i = 1
+
+        # Check each figure: FIGURE "(" SIZE COLOR ")"
+        while i < n and tokens[i].type_ == "FIGURE":
+            for type_, value, expected in tail:
+                i += 1
+                if (
+                    i >= n
+                    or tokens[i].type_ != type_
+                    or (value is not None and tokens[i].value != value)
+                ):
+                    self.error(i, expected)
+            figures.append((tokens[i - 4].value, tokens[i - 2].value, tokens[i - 1].value))
+            i += 1
+
+        # Check that the sequence ends with 'END' and nothing follows it.
+        if i >= n or tokens[i].type_ != "KEYWORDS" or tokens[i].value != "END":
+            self.error(i, "END")
+        if i + 1 < n:
+            self.error(i + 1, "No extra tokens expected after END")
+
+        if self.verbose and figures:
+            print("\n".join(
+                f"Figure: {figure}({size} {color})" for figure, size, color in figures
+            ))
+
+        return figures
+
+    def error(self, pos, expected):
+        """
+        Raises a SyntaxError when the token at the given position does not match the expected token.
         
         Args:
+            pos (int): The position of the offending token.
             expected (str): The expected token or description of the expected input.
         
         Raises:
             SyntaxError: Indicates the mismatch between the expected token and the actual token.
         """
          
+        found = self.tokens[pos] if pos < len(self.tokens) else None
         raise SyntaxError(
-            f"Syntax error: expected {expected}, found {self.current_token}"
+            f"Syntax error: expected {expected}, found {found}"
         )
\ No newline at end of file